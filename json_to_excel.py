@@ -6,9 +6,174 @@ import json
 import sys
 from datetime import datetime
 from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-import pandas as pd
+from typing import Iterable, Iterator, List, Dict
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
+# Column widths by field name; anything else gets DEFAULT_WIDTH
+COL_WIDTHS = {
+    'url': 40, 'title': 50, 'description': 60, 'published': 25,
+    'content': 80, 'summary': 80, 'scraped_at': 25,
+}
+DEFAULT_WIDTH = 20
+
+# Files above this size are streamed in batches instead of loaded whole
+STREAM_THRESHOLD = 100 * 1024 * 1024
+BATCH_SIZE = 10_000
+
+if not HAS_XLSXWRITER:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.utils import get_column_letter
+
+    # Shared styles, built once and reused by every cell
+    HEADER_FONT = Font(bold=True, color='FFFFFF')
+    HEADER_FILL = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+    THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    WRAP_ALIGN = Alignment(wrap_text=True, vertical='top')
+    CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+
+
+def _load_json(json_path: Path) -> List[Dict]:
+    """Load the whole JSON array, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(json_path.read_bytes())
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _iter_batches(json_path: Path) -> Iterator[List[Dict]]:
+    """Yield records from a top-level JSON array in batches of BATCH_SIZE"""
+    with open(json_path, 'rb') as f:
+        batch = []
+        for record in ijson.items(f, 'item', use_float=True):
+            batch.append(record)
+            if len(batch) >= BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _scan_fields(json_path: Path) -> List[str]:
+    """Column names in first-seen order, from a key-only ijson pass over the file"""
+    fields = {}
+    with open(json_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'item' and event == 'map_key':
+                fields.setdefault(value, None)
+    return list(fields)
+
+
+def _get_fields(data: List[Dict]) -> List[str]:
+    """Column names in first-seen order across all records"""
+    fields = {}
+    for record in data:
+        for key in record:
+            fields.setdefault(key, None)
+    return list(fields)
+
+
+def _cell_value(value):
+    """Pass through values Excel can store natively; stringify everything else"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _write_xlsxwriter(batches: Iterable[List[Dict]], fields: List[str], output_file: str) -> int:
+    """Write data and styling row by row with xlsxwriter"""
+    total = 0
+    
+    # Rows are written strictly in order, so constant_memory can flush each one
+    wb = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'strings_to_urls': False})
+    ws = wb.add_worksheet('Articles')
+    
+    header_fmt = wb.add_format({
+        'bold': True, 'bg_color': '#4472C4', 'font_color': '#FFFFFF',
+        'align': 'center', 'valign': 'vcenter', 'border': 1,
+    })
+    body_fmt = wb.add_format({'text_wrap': True, 'valign': 'top', 'border': 1})
+    
+    # Column widths
+    for col, name in enumerate(fields):
+        ws.set_column(col, col, COL_WIDTHS.get(name, DEFAULT_WIDTH))
+    
+    # Freeze header
+    ws.freeze_panes(1, 0)
+    
+    # Header
+    ws.write_row(0, 0, fields, header_fmt)
+    
+    # Data rows
+    for batch in batches:
+        for record in batch:
+            total += 1
+            ws.write_row(total, 0, [_cell_value(record.get(f, "")) for f in fields], body_fmt)
+    
+    wb.close()
+    return total
+
+
+def _write_openpyxl(batches: Iterable[List[Dict]], fields: List[str], output_file: str) -> int:
+    """Stream rows into a write-only openpyxl workbook"""
+    total = 0
+    
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Articles')
+    
+    # Column widths and freeze must be set before the first append
+    for col, name in enumerate(fields, start=1):
+        ws.column_dimensions[get_column_letter(col)].width = COL_WIDTHS.get(name, DEFAULT_WIDTH)
+    ws.freeze_panes = 'A2'
+    
+    # Header
+    header_cells = []
+    for name in fields:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = THIN_BORDER
+        header_cells.append(cell)
+    ws.append(header_cells)
+    
+    # Data rows
+    for batch in batches:
+        for record in batch:
+            row = []
+            for key in fields:
+                cell = WriteOnlyCell(ws, value=_cell_value(record.get(key)))
+                cell.alignment = WRAP_ALIGN
+                cell.border = THIN_BORDER
+                row.append(cell)
+            ws.append(row)
+        total += len(batch)
+    
+    wb.save(output_file)
+    return total
 
 
 def convert_json_to_excel(json_file: str, output_file: str = None):
@@ -20,10 +185,15 @@ def convert_json_to_excel(json_file: str, output_file: str = None):
         print(f"Error: {json_file} not found")
         sys.exit(1)
     
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    print(f"Loaded {len(data)} articles from {json_file}")
+    if HAS_IJSON and json_path.stat().st_size > STREAM_THRESHOLD:
+        fields = _scan_fields(json_path)
+        batches = _iter_batches(json_path)
+        print(f"Streaming articles from {json_file}")
+    else:
+        data = _load_json(json_path)
+        fields = _get_fields(data)
+        batches = [data]
+        print(f"Loaded {len(data)} articles from {json_file}")
     
     # Generate output filename with date if not specified
     if output_file is None:
@@ -31,59 +201,12 @@ def convert_json_to_excel(json_file: str, output_file: str = None):
         base_name = json_path.stem  # Remove .json extension
         output_file = f"{base_name}_{date_str}.xlsx"
     
-    # Create DataFrame
-    df = pd.DataFrame(data)
+    if HAS_XLSXWRITER:
+        total = _write_xlsxwriter(batches, fields, output_file)
+    else:
+        total = _write_openpyxl(batches, fields, output_file)
     
-    # Save to Excel
-    df.to_excel(output_file, sheet_name='Articles', index=False)
-    print(f"Exported to {output_file}")
-    
-    # Apply styling
-    wb = load_workbook(output_file)
-    ws = wb.active
-    
-    # Header styling
-    header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-    header_font = Font(bold=True, color='FFFFFF')
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # Apply header style
-    for col in range(1, len(df.columns) + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = thin_border
-    
-    # Apply data styling
-    for row in range(2, len(df) + 2):
-        for col in range(1, len(df.columns) + 1):
-            cell = ws.cell(row=row, column=col)
-            cell.border = thin_border
-            cell.alignment = Alignment(wrap_text=True, vertical='top')
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 40  # url
-    ws.column_dimensions['B'].width = 50  # title
-    ws.column_dimensions['C'].width = 60  # description
-    ws.column_dimensions['D'].width = 25  # published
-    if len(df.columns) > 4:
-        ws.column_dimensions['E'].width = 80  # content
-    if len(df.columns) > 5:
-        ws.column_dimensions['F'].width = 80  # summary
-    if len(df.columns) > 6:
-        ws.column_dimensions['G'].width = 25  # scraped_at
-    
-    # Freeze header
-    ws.freeze_panes = 'A2'
-    
-    wb.save(output_file)
-    print(f"Styling applied")
+    print(f"Exported {total} articles to {output_file}")
     
     # File stats
     import os
@@ -1,14 +1,18 @@
-from flask import Flask, request, redirect
+from flask import Flask, request, redirect, abort
+from flask.helpers import get_debug_flag
+import os
 import random
 
 app = Flask(__name__)
 
 nextID = 4
-topics = [
+topics_list = [
     {'id':1, 'title':'html', 'body' :'html is ...'},
     {'id':2, 'title':'css', 'body' :'css is ...'},
     {'id':3, 'title':'javascript', 'body' :'javascript is ...'}
 ]
+topics_by_id = {topic['id']: topic for topic in topics_list}
+contentsCache = None  # rendered <li> list, reset whenever a topic is added
 
 def template(contents, content):
     return f'''<!doctype html>
@@ -27,10 +31,12 @@ def template(contents, content):
     '''
 
 def getContents():
-    liTags = ''
-    for topic in topics:
-        liTags += f'<li><a href="/user/{topic["id"]}/">{topic["title"]}</a></li>'
-    return liTags
+    global contentsCache
+    if contentsCache is None:
+        contentsCache = ''.join(
+            f'<li><a href="/user/{topic["id"]}/">{topic["title"]}</a></li>' for topic in topics_list
+        )
+    return contentsCache
 
 @app.route('/')
 def index():
@@ -40,14 +46,11 @@ def index():
 @app.route('/user/<int:id>/')
 def userID(id):
 
-    title = ''
-    body = ''
-
-    for topic in topics:
-        if id == topic['id']:
-            title = topic['title']
-            body = topic['body']
-            break
+    topic = topics_by_id.get(id)
+    if not topic:
+        abort(404)
+    title = topic['title']
+    body = topic['body']
     print(title, body)
     return template(getContents(), f'<h2>{title}</h2>{body}' )
 
@@ -63,11 +66,13 @@ def create():
         '''
         return template(getContents(), content)
     elif request.method == 'POST':
-        global nextID
+        global nextID, contentsCache
         title = request.form['title']
         body = request.form['body']
         newTopic = {'id':nextID, 'title':title, 'body':body}
-        topics.append(newTopic)
+        topics_list.append(newTopic)
+        topics_by_id[nextID] = newTopic
+        contentsCache = None
         url = '/user/'+ str(nextID) + '/'
         nextID += 1
         return redirect(url)
@@ -86,4 +91,8 @@ def wait():
     '''
 
 if __name__ == '__main__':
-    app.run(port=5000, debug=True)
\ No newline at end of file
+    if get_debug_flag():
+        app.run(port=5000, debug=True)
+    else:
+        from waitress import serve
+        serve(app, host=os.environ.get('HOST', '127.0.0.1'), port=5000, threads=8)
\ No newline at end of file
@@ -8,21 +8,43 @@ with optional neural summarization and strict body extraction.
 Usage:
   python yahoo_finance_news_scraper_v3.py --topics latest-news --count 3
   python yahoo_finance_news_scraper_v3.py --topics latest-news stock-market earnings --count 5 --summarizer neural
+  python yahoo_finance_news_scraper_v3.py --topics latest-news --concurrency 8
+  python yahoo_finance_news_scraper_v3.py --topics latest-news --refresh
 """
 import argparse
 import csv
+import heapq
 import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict
 from collections import Counter
+from itertools import chain
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
 
 try:
-    from transformers import pipeline
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from transformers import AutoTokenizer, pipeline
     HAS_TRANSFORMERS = True
 except ImportError:
     HAS_TRANSFORMERS = False
@@ -39,6 +61,90 @@ TOPIC_URLS = {
     "tech": "https://finance.yahoo.com/topic/tech/",
 }
 
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+_WORD_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset({'the','and','a','to','of','in','is','for','on','that','with','as','by','at','it','from','be'})
+
+# Shared keep-alive session for listings and articles, so every request
+# after the first reuses a pooled connection instead of a new TLS handshake.
+# main() swaps in a requests-cache session when it is installed, so unchanged
+# pages are served from a local sqlite cache across runs.
+CACHE_FILE = str(Path(__file__).resolve().with_name("yahoo_cache.sqlite"))
+CACHE_EXPIRE = 3600  # seconds
+
+
+class RateLimiter:
+    """Spaces calls to wait() at least `interval` seconds apart across all threads"""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that waits on a shared RateLimiter before each request.
+    
+    requests-cache only reaches the adapter on a cache miss, so responses
+    served from sqlite are never delayed.
+    """
+    def __init__(self, limiter: RateLimiter = None, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        if self.limiter:
+            self.limiter.wait()
+        return super().send(request, **kwargs)
+
+
+def make_session(cache_file: str = None, pool_size: int = 10, delay: float = 0.0) -> requests.Session:
+    """Build the shared session, backed by an on-disk cache if cache_file is given.
+    
+    pool_size should be at least the number of concurrent workers, otherwise
+    urllib3 discards the surplus connections instead of keeping them alive.
+    Requests that go out to the network start at least `delay` seconds apart.
+    """
+    if cache_file and HAS_REQUESTS_CACHE:
+        session = requests_cache.CachedSession(
+            cache_file, backend="sqlite", expire_after=CACHE_EXPIRE, allowable_methods=("GET",)
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", ThrottledAdapter(RateLimiter(delay), pool_connections=pool_size, pool_maxsize=pool_size,
+                                               max_retries=Retry(total=3, backoff_factor=0.3)))
+    return session
+
+
+SESSION = make_session()
+
+# finance.yahoo.com news articles, excluding anchors and subscribe/javascript links
+_ARTICLE_RE = re.compile(r"^https?://finance\.yahoo\.com/news/(?!.*(?:subscribe|javascript:))[^#]*$")
+
+# Article body containers, tried in order
+_BODY_SELECTORS = [CSSSelector(sel, translator="html") for sel in ("article", "div[class*='caas-body']", "div[role='main']")]
+
+# Attribute lookups return plain str: lxml's default "smart strings" keep a
+# reference to their element, and through it the whole parsed page
+_NEWS_HREF_XPATH = etree.XPath('//a[contains(@href, "/news/")]/@href', smart_strings=False)
+_OG_TITLE_XPATH = etree.XPath('//meta[@property="og:title"]/@content', smart_strings=False)
+_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]/@content', smart_strings=False)
+_PUBLISHED_XPATH = etree.XPath("(//time)[1]/@datetime", smart_strings=False)
+
+# Paragraphs outside script/style/nav, so the tree never needs pruning
+_P_XPATH = etree.XPath(".//p[not(ancestor::script or ancestor::style or ancestor::nav)]")
+
+CSV_FIELDS = ("url", "title", "description", "published", "content", "summary", "scraped_at", "error")
+CSV_CHUNK = 10_000  # rows built and written per writerows call
+
 
 class Summarizer:
     def __init__(self, method: str = "extractive"):
@@ -47,7 +153,9 @@ class Summarizer:
         if method == "neural":
             if HAS_TRANSFORMERS:
                 try:
-                    self.pipeline = pipeline("summarization", model="google/pegasus-xsum")
+                    # Fast tokenizer truncates over-long input to the model limit in Rust
+                    tokenizer = AutoTokenizer.from_pretrained("google/pegasus-xsum", use_fast=True)
+                    self.pipeline = pipeline("summarization", model="google/pegasus-xsum", tokenizer=tokenizer)
                     print("✓ Pegasus model loaded for neural summarization\n")
                 except Exception as e:
                     print(f"⚠ Pegasus load failed: {e}. Using extractive.\n")
@@ -62,38 +170,45 @@ class Summarizer:
         
         if self.method == "neural" and self.pipeline:
             try:
-                words = text.split()
-                if len(words) > 1000:
-                    text = " ".join(words[:1000])
-                result = self.pipeline(text, max_length=100, min_length=30, do_sample=False)
+                result = self.pipeline(text, max_length=100, min_length=30, truncation=True, do_sample=False)
                 return result[0]["summary_text"] if result else self._extractive(text, max_sents)
             except:
                 return self._extractive(text, max_sents)
         return self._extractive(text, max_sents)
     
+    def summarize_batch(self, texts: List[str], max_sents: int = 3, batch_size: int = 16) -> List[str]:
+        """Summarize many texts, running the neural pipeline over them in batches"""
+        if not (self.method == "neural" and self.pipeline):
+            return [self.summarize(t, max_sents) for t in texts]
+        
+        summaries = [self.summarize(t, max_sents) if not t or len(t) < 50 else None for t in texts]
+        pending = [i for i, s in enumerate(summaries) if s is None]
+        if not pending:
+            return summaries
+        try:
+            results = self.pipeline([texts[i] for i in pending], max_length=100, min_length=30,
+                                    truncation=True, batch_size=batch_size, do_sample=False)
+            for i, r in zip(pending, results):
+                summaries[i] = r["summary_text"]
+        except:
+            for i in pending:
+                summaries[i] = self._extractive(texts[i], max_sents)
+        return summaries
+    
     def _extractive(self, text: str, max_sents: int = 3) -> str:
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENT_RE.split(text)
         if len(sentences) <= max_sents:
             return text.strip()
         
-        stopwords = {'the','and','a','to','of','in','is','for','on','that','with','as','by','at','it','from','be'}
-        words = [w.lower() for w in re.findall(r"\w+", text) if w.lower() not in stopwords and len(w) > 2]
-        if not words:
+        # Tokenize each sentence once; reuse the tokens for counting and scoring
+        sent_words = [_WORD_RE.findall(s.lower()) for s in sentences]
+        freqs = Counter(w for w in chain.from_iterable(sent_words) if w not in _STOPWORDS and len(w) > 2)
+        if not freqs:
             return " ".join(sentences[:max_sents])
         
-        freqs = Counter(words)
-        scores = []
-        for s in sentences:
-            if s.strip():
-                sw = [w.lower() for w in re.findall(r"\w+", s)]
-                score = sum(freqs.get(w, 0) for w in sw) / max(len(sw), 1)
-                scores.append((s, score))
-            else:
-                scores.append((s, 0))
-        
-        top = sorted(scores, key=lambda x: x[1], reverse=True)[:max_sents]
-        top_idx = {scores.index(t) for t in top}
-        return " ".join(s for i, (s, _) in enumerate(scores) if i in top_idx).strip()
+        scores = [sum(freqs.get(w, 0) for w in sw) / max(len(sw), 1) for sw in sent_words]
+        top_idx = sorted(heapq.nlargest(max_sents, range(len(sentences)), key=scores.__getitem__))
+        return " ".join(sentences[i] for i in top_idx).strip()
 
 
 def get_listing(url: str, max_pages: int = None) -> List[str]:
@@ -109,27 +224,17 @@ def get_listing(url: str, max_pages: int = None) -> List[str]:
             page_url = f"{url}?count=100&offset={page * 100}" if page > 0 else url
             print(f"  Fetching page {page + 1}...")
             
-            resp = requests.get(page_url, headers=HEADERS, timeout=15, verify=False)
+            resp = SESSION.get(page_url, timeout=15)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            doc = lxml_html.fromstring(resp.content)
             
             page_links = []
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                # Look for news article links
-                if "/news/" not in href or any(x in href for x in ["#", "javascript:", "subscribe"]):
-                    continue
-                
+            for href in _NEWS_HREF_XPATH(doc):
                 # Clean up URL
-                if href.startswith("/"):
-                    full = requests.compat.urljoin(url, href)
-                elif href.startswith("http"):
-                    full = href
-                else:
-                    continue
+                full = requests.compat.urljoin(url, href) if href.startswith("/") else href
                 
                 # Ensure it's a valid finance.yahoo.com article
-                if full and full not in seen and "finance.yahoo.com" in full:
+                if _ARTICLE_RE.match(full) and full not in seen:
                     seen.add(full)
                     page_links.append(full)
             
@@ -142,7 +247,8 @@ def get_listing(url: str, max_pages: int = None) -> List[str]:
             print(f"  Found {len(page_links)} links on page {page + 1} (total so far: {len(links)})")
             
             page += 1
-            time.sleep(0.5)  # Be polite between pages
+            if not getattr(resp, "from_cache", False):
+                time.sleep(0.5)  # Be polite between pages
         
         except Exception as e:
             print(f"  Error fetching page {page + 1}: {e}")
@@ -152,62 +258,73 @@ def get_listing(url: str, max_pages: int = None) -> List[str]:
     return links
 
 
-def extract_body(soup: BeautifulSoup) -> str:
+def _paragraphs(node) -> List[str]:
+    """Stripped text of every <p> under node longer than 20 chars"""
+    parts = (p.text_content().strip() for p in _P_XPATH(node))
+    return [t for t in parts if len(t) > 20]
+
+
+def extract_body(doc) -> str:
     """Strict article body extraction"""
     # Try main article containers
-    for selector in [("article", {}), ("div", {"class": re.compile(r"caas-body")}), ("div", {"role": "main"})]:
-        try:
-            node = soup.find(selector[0], selector[1] if selector[1] else None)
-            if not node:
-                continue
-            for tag in node.find_all(["script", "style", "nav"]):
-                tag.decompose()
-            ps = node.find_all("p")
-            if ps:
-                parts = [p.get_text(strip=True) for p in ps if len(p.get_text(strip=True)) > 20]
-                if parts and len("\n\n".join(parts)) > 200:
-                    return "\n\n".join(parts)
-        except:
+    for selector in _BODY_SELECTORS:
+        nodes = selector(doc)
+        if not nodes:
             continue
+        joined = "\n\n".join(_paragraphs(nodes[0]))
+        if len(joined) > 200:
+            return joined
     
     # Fallback: all paragraphs with filtering
-    ps = soup.find_all("p")
-    parts = [p.get_text(strip=True) for p in ps if len(p.get_text(strip=True)) > 20]
+    parts = _paragraphs(doc)
     return "\n\n".join(parts[:20]) if parts and len("\n\n".join(parts[:20])) > 200 else None
 
 
-def fetch_article(url: str, summarizer: Summarizer) -> Dict:
+def fetch_article(url: str, ts: str) -> Dict:
     out = {
         "url": url, "title": None, "description": None, "published": None,
-        "content": None, "summary": None, "scraped_at": datetime.now().isoformat()
+        "content": None, "summary": None, "scraped_at": ts
     }
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15, verify=False)
+        resp = SESSION.get(url, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        doc = lxml_html.fromstring(resp.content)
         
-        h1 = soup.find("h1")
-        out["title"] = h1.get_text(strip=True) if h1 else None
+        h1 = doc.xpath("(//h1)[1]")
+        out["title"] = h1[0].text_content().strip() if h1 else None
         if not out["title"]:
-            og = soup.find("meta", property="og:title")
-            out["title"] = og.get("content", "").strip() if og else None
+            og = _OG_TITLE_XPATH(doc)
+            out["title"] = og[0].strip() if og else None
         
-        desc = soup.find("meta", attrs={"name": "description"})
-        out["description"] = desc.get("content", "").strip() if desc else None
+        desc = _DESCRIPTION_XPATH(doc)
+        out["description"] = desc[0].strip() if desc else None
         
-        time_tag = soup.find("time")
-        out["published"] = time_tag.get("datetime") if time_tag else None
+        published = _PUBLISHED_XPATH(doc)
+        out["published"] = published[0] if published else None
         
-        body = extract_body(soup)
-        if body:
-            out["content"] = body
-            out["summary"] = summarizer.summarize(body)
+        out["content"] = extract_body(doc)
     except Exception as e:
         out["error"] = str(e)
     return out
 
 
+def fetch_articles(links: List[str], ts: str, concurrency: int = 1) -> List[Dict]:
+    """Fetch articles with up to `concurrency` requests in flight, keeping link order.
+    
+    Pacing is left to SESSION's ThrottledAdapter, so only cache misses wait.
+    """
+    def fetch_one(i: int, link: str) -> Dict:
+        print(f"  [{i}/{len(links)}] {link[:80]}...")
+        return fetch_article(link, ts)
+    
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        return list(pool.map(fetch_one, range(1, len(links) + 1), links))
+
+
 def save_json(items: List[Dict], path: str):
+    if HAS_ORJSON:
+        Path(path).write_bytes(orjson.dumps(items, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(items, f, indent=2, ensure_ascii=False)
 
@@ -217,10 +334,10 @@ def save_csv(items: List[Dict], path: str):
         open(path, "w").close()
         return
     with open(path, "w", newline='', encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["url", "title", "description", "published", "content", "summary", "scraped_at", "error"])
-        writer.writeheader()
-        for item in items:
-            writer.writerow({k: item.get(k, "") for k in writer.fieldnames})
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for start in range(0, len(items), CSV_CHUNK):
+            writer.writerows([[item.get(k, "") for k in CSV_FIELDS] for item in items[start:start + CSV_CHUNK]])
 
 
 def main():
@@ -229,13 +346,22 @@ def main():
     parser.add_argument("--count", type=int, default=None, help="Max articles per topic (None = fetch all)")
     parser.add_argument("--output", type=str, default="news.json")
     parser.add_argument("--format", choices=["json", "csv"], default="json")
-    parser.add_argument("--delay", type=float, default=0.5, help="Delay between article fetches (seconds)")
+    parser.add_argument("--delay", type=float, default=0.5, help="Minimum interval between network requests, shared by all workers; cached pages are not delayed (seconds)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Articles fetched in parallel (still rate-limited by --delay)")
     parser.add_argument("--summarizer", choices=["extractive", "neural"], default="extractive")
     parser.add_argument("--max-pages", type=int, default=None, help="Max pages to scrape per topic (None = unlimited)")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached pages and fetch everything again")
+    parser.add_argument("--cache-file", type=str, default=CACHE_FILE, help="sqlite page cache (requires requests-cache)")
     args = parser.parse_args()
     
+    global SESSION
+    SESSION = make_session(args.cache_file, pool_size=max(args.concurrency, 1), delay=args.delay)
+    if args.refresh and hasattr(SESSION, "cache"):
+        SESSION.cache.clear()
+    
     summarizer = Summarizer(args.summarizer)
     all_items = []
+    run_ts = datetime.now().isoformat()  # one scraped_at stamp for the whole run
     
     for topic in args.topics:
         url = TOPIC_URLS[topic]
@@ -246,11 +372,15 @@ def main():
         articles_to_fetch = links if args.count is None else links[:args.count]
         print(f"  Fetching {len(articles_to_fetch)} articles out of {len(links)} found\n")
         
-        for i, link in enumerate(articles_to_fetch, 1):
-            print(f"  [{i}/{len(articles_to_fetch)}] {link[:80]}...")
-            item = fetch_article(link, summarizer)
-            all_items.append(item)
-            time.sleep(args.delay)
+        all_items.extend(fetch_articles(articles_to_fetch, run_ts, args.concurrency))
+    
+    # Summarize everything in one pass so the neural model sees full batches
+    pending = [item for item in all_items if item.get("content")]
+    if pending:
+        print(f"\nSummarizing {len(pending)} articles...")
+        summaries = summarizer.summarize_batch([item["content"] for item in pending])
+        for item, summary in zip(pending, summaries):
+            item["summary"] = summary
     
     if args.format == "json":
         save_json(all_items, args.output)